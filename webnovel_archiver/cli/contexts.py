@@ -1,10 +1,13 @@
 import os
-from typing import Optional, Dict, Any, Union
+import re
+from typing import Optional, Dict, Any
 import json
 
 from webnovel_archiver.core.config_manager import ConfigManager, DEFAULT_WORKSPACE_PATH
 from webnovel_archiver.utils.logger import get_logger
 from webnovel_archiver.core.path_manager import PathManager
+from webnovel_archiver.core.storage.index_manager import load_index
+from webnovel_archiver.core.cloud_sync import GDriveSync, BaseSyncService
 
 logger = get_logger(__name__)
 
@@ -140,7 +143,6 @@ class ArchiveStoryContext:
         # So, basic validity holds. Add more checks if preconditions for orchestrator aren't met.
         return True
 
-from webnovel_archiver.core.cloud_sync import GDriveSync, BaseSyncService
 # Removed import of WORKSPACE_ARCHIVAL_STATUS_DIR and WORKSPACE_EBOOKS_DIR from progress_manager
 # They will be replaced by PathManager constants.
 
@@ -187,12 +189,11 @@ class CloudBackupContext:
 
     def _load_story_index(self) -> Dict[str, str]:
         index_path = os.path.join(self.workspace_root, PathManager.INDEX_FILENAME)
-        if not os.path.exists(index_path):
+        try:
+            return load_index(index_path)
+        except FileNotFoundError:
             self.error_messages.append(f"Error: Story index file not found at {index_path}. Cannot proceed.")
             return {}
-        try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             self.error_messages.append(f"Error: Failed to load or parse story index file: {e}")
             return {}
@@ -327,8 +328,6 @@ class CloudBackupContext:
         return not self.error_messages # Valid if no critical errors accumulated
 
 
-import re
-
 # ... (other imports like os, Optional, List, ConfigManager, DEFAULT_WORKSPACE_PATH, logger should be there)
 # Ensure WORKSPACE_ARCHIVAL_STATUS_DIR and WORKSPACE_EBOOKS_DIR are available if used directly by name
 # or ensure they are part of ConfigManager or another central place if accessed that way.
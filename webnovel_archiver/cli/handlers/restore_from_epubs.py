@@ -90,7 +90,7 @@ def handle_restore_from_epubs():
         epub_path = None
         # Strategy 1: Look in story-specific ebook directory: workspace/ebooks/<story_id>/
         story_specific_ebook_dir = os.path.join(ebooks_base_dir, story_id)
-        logger_restore.debug(f"Checking story-specific EPUB directory: {story_specific_ebook_dir}")
+        logger_restore.debug("Checking story-specific EPUB directory: %s", story_specific_ebook_dir)
         if os.path.isdir(story_specific_ebook_dir):
             for item in os.listdir(story_specific_ebook_dir):
                 if item.lower().endswith('.epub'):
@@ -104,7 +104,7 @@ def handle_restore_from_epubs():
             potential_epub_name = f"{story_title}.epub"
             # Sanitize story_title for use as a filename if necessary (not done here, assuming titles are safe)
             path_strat2 = os.path.join(ebooks_base_dir, potential_epub_name)
-            logger_restore.debug(f"Checking for EPUB by title: {path_strat2}")
+            logger_restore.debug("Checking for EPUB by title: %s", path_strat2)
             if os.path.isfile(path_strat2):
                 epub_path = path_strat2
                 logger_restore.info(f"Found EPUB by title: {epub_path}")
@@ -186,7 +186,7 @@ def handle_restore_from_epubs():
                     click.echo(click.style(f"  CRITICAL: Chapter count mismatch for '{story_id}'. Progress: {num_chapters_in_progress}, EPUB: {num_chapters_in_epub} (Pattern: '{used_pattern_description}'). Skipping.", fg="red"))
                     # Log more details if count mismatches, this can help diagnose pattern issues
                     if num_chapters_in_epub > 0 : # Only log if files were actually found
-                        logger_restore.debug(f"Files found by pattern '{used_pattern_description}' for '{story_id}': {chapter_files_in_epub[:10]}") # Log first 10
+                        logger_restore.debug("Files found by pattern '%s' for '%s': %s", used_pattern_description, story_id, chapter_files_in_epub[:10]) # Log first 10
                     if abs(num_chapters_in_progress - num_chapters_in_epub) > 5 and num_chapters_in_epub > num_chapters_in_progress : # Arbitrary threshold for "too many files"
                         logger_restore.warning(f"Pattern '{used_pattern_description}' yielded significantly more files ({num_chapters_in_epub}) than expected ({num_chapters_in_progress}) for story '{story_id}'. This pattern might be too broad for this EPUB structure.")
 
@@ -214,7 +214,7 @@ def handle_restore_from_epubs():
                         chapter_content_bytes = epub_archive.read(epub_chapter_source_path)
                         with open(target_path, 'wb') as f_out:
                             f_out.write(chapter_content_bytes)
-                        # logger_restore.debug(f"Restored '{target_filename}' from '{epub_chapter_source_path}'")
+                        # logger_restore.debug("Restored '%s' from '%s'", target_filename, epub_chapter_source_path)
                         restored_files_count += 1
                     except KeyError:
                         logger_restore.error(f"File '{epub_chapter_source_path}' not found in EPUB archive for story '{story_id}', though it was listed. Skipping this chapter.", exc_info=True)
@@ -2,7 +2,9 @@ import os
 import json
 import click
 from webnovel_archiver.core.path_manager import PathManager
+from webnovel_archiver.core.storage.index_manager import save_index
 from webnovel_archiver.core.fetchers.fetcher_factory import FetcherFactory
+from webnovel_archiver.utils.json_utils import load_json_file
 from webnovel_archiver.utils.logger import get_migration_logger
 
 migration_logger = get_migration_logger()
@@ -33,8 +35,7 @@ def migrate_legacy_archive(path_manager: PathManager):
         click.echo(f"Warning: {message}")
         migration_logger.warning(message)
         # Create an empty index file to prevent this from running again
-        with open(path_manager.index_path, 'w') as f:
-            json.dump({}, f)
+        save_index(path_manager.index_path, {})
         return
 
     for story_folder in os.listdir(archival_status_dir):
@@ -45,8 +46,7 @@ def migrate_legacy_archive(path_manager: PathManager):
             continue
 
         try:
-            with open(progress_path, 'r') as f:
-                progress_data = json.load(f)
+            progress_data = load_json_file(progress_path)
             
             url = progress_data.get('url')
             if not url:
@@ -75,5 +75,4 @@ def migrate_legacy_archive(path_manager: PathManager):
             click.echo(f"Warning: {message}")
             migration_logger.error(message, exc_info=True)
 
-    with open(path_manager.index_path, 'w') as f:
-        json.dump(index, f, indent=4)
+    save_index(path_manager.index_path, index)
@@ -1,67 +1,117 @@
-import ebooklib # type: ignore
-from ebooklib import epub
+from ebooklib import epub # type: ignore
+import mmap
 import os
-import datetime
+import re
 import requests
-import shutil
-import imghdr
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
 from webnovel_archiver.utils.logger import get_logger
 from webnovel_archiver.core.path_manager import PathManager
 from webnovel_archiver.core.storage.progress_manager import add_epub_file_to_progress
 
 logger = get_logger(__name__)
 
+# Default deflate level for EPUB archives (ebooklib defaults to 6). Generated books are written
+# once and kept, so the extra compression time is worth the smaller files. Callers wanting quick
+# draft builds can pass a lower compresslevel (e.g. 1) to generate_epub.
+EPUB_COMPRESSLEVEL = 9
+
+# Upper bound on volumes written concurrently. Deflate releases the GIL, so volumes of
+# a multi-volume story compress in parallel.
+MAX_PARALLEL_EPUB_WRITES = 4
+
+# Anything other than letters, digits, '_' and '.' becomes '_' in EPUB file names (spaces included)
+_FILENAME_UNSAFE_CHARS = re.compile(r'[^\w.]')
+
+# Chapter files at least this large are decoded straight from a memory map instead of
+# being read into an intermediate bytes buffer first.
+MMAP_CHAPTER_THRESHOLD_BYTES = 256 * 1024
+
+# Leading bytes of the cover formats we recognise, mapped to the file extension used in the EPUB
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+
+def _detect_image_type(data: bytes) -> Optional[str]:
+    """Returns 'png', 'jpeg', 'gif' or 'webp' from the image's magic bytes, or None if unrecognised."""
+    for signature, image_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return image_type
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
 class EPUBGenerator:
+    # Shared by all instances so cover downloads for successive stories reuse pooled connections
+    _session: Optional[requests.Session] = None
+
     def __init__(self, path_manager: PathManager):
         self.pm = path_manager
 
-    def _download_cover_image(self, cover_url: str) -> Optional[str]:
-        """Downloads the cover image and returns the local path."""
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Returns the shared HTTP session, creating it with retrying adapters on first use."""
+        if cls._session is None:
+            session = requests.Session()
+            # Retry-After is ignored so a 503 with a long delay cannot stall EPUB generation; backoff_factor bounds the waits instead
+            retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504), respect_retry_after_header=False)
+            adapter = HTTPAdapter(max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            cls._session = session
+        return cls._session
+
+    def _download_cover_image(self, cover_url: Optional[str]) -> Optional[Tuple[str, bytes]]:
+        """
+        Downloads the cover image into memory and returns its (file name, bytes).
+        Called once per generate_epub run so every volume can embed the same image.
+        """
         if not cover_url:
             return None
 
         story_id = self.pm.get_story_id()
 
         try:
-            response = requests.get(cover_url, stream=True)
+            response = self._get_session().get(cover_url, timeout=15)
             response.raise_for_status()
-
-            # Ensure the temp directory for covers exists
-            temp_cover_path = self.pm.get_temp_cover_story_dir()
-            os.makedirs(temp_cover_path, exist_ok=True)
-
-            local_filename = f"cover.tmp"
-            file_path = str(self.pm.get_cover_image_filepath(local_filename))
-
-            # Determine file extension
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            image_type = imghdr.what(file_path)
-            if image_type:
-                ext = f'.{image_type}'
-                # Rename the file if the extension is different
-                if not file_path.endswith(ext):
-                    new_file_path = os.path.splitext(file_path)[0] + ext
-                    os.rename(file_path, new_file_path)
-                    file_path = new_file_path
-            else:
-                ext = '.jpg' # Fallback
-                logger.warning(f"Could not determine cover image type for {story_id}. Assuming JPG.")
-
-            logger.info(f"Cover image downloaded for story {self.pm.get_story_id()} to {file_path}")
-            return file_path
+            cover_image_data = response.content
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to download cover image for story {self.pm.get_story_id()} from {cover_url}: {e}")
-            return None
-        except IOError as e:
-            logger.error(f"Failed to save cover image for story {self.pm.get_story_id()} in {temp_cover_path}: {e}")
+            logger.error(f"Failed to download cover image for story {story_id} from {cover_url}: {e}")
             return None
 
+        # Determine file extension from the image header
+        image_type = _detect_image_type(cover_image_data)
+        if image_type:
+            ext = f'.{image_type}'
+        else:
+            ext = '.jpg' # Fallback
+            logger.warning(f"Could not determine cover image type for {story_id}. Assuming JPG.")
+
+        logger.info(f"Cover image downloaded for story {story_id} ({len(cover_image_data)} bytes)")
+        return f"cover{ext}", cover_image_data
+
+    def _read_chapter_html(self, html_file_path: str) -> str:
+        """Reads a processed chapter file as UTF-8 text."""
+        if os.stat(html_file_path).st_size >= MMAP_CHAPTER_THRESHOLD_BYTES:
+            with open(html_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, 'utf-8')
+        with open(html_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _write_epub_file(self, book: epub.EpubBook, epub_filepath: str, compresslevel: int = EPUB_COMPRESSLEVEL) -> Optional[Exception]:
+        """Writes one volume to disk. Returns the error instead of raising so parallel writes can be reported in volume order."""
+        try:
+            epub.write_epub(epub_filepath, book, {"compresslevel": compresslevel})
+            return None
+        except Exception as e:
+            return e
 
-    def generate_epub(self, progress_data: Dict[Any, Any], chapters_per_volume: Optional[int] = None) -> Dict[Any, Any]:
+    def generate_epub(self, progress_data: Dict[Any, Any], chapters_per_volume: Optional[int] = None, compresslevel: int = EPUB_COMPRESSLEVEL) -> Dict[Any, Any]:
         story_id = self.pm.get_story_id()
         downloaded_chapters = progress_data.get("downloaded_chapters", [])
 
@@ -69,23 +119,27 @@ class EPUBGenerator:
             logger.warning(f"No chapters downloaded for story {story_id}. Cannot generate EPUB.")
             return progress_data
 
-        active_chapters = [c for c in downloaded_chapters if c.get("status") != 'archived']
-        archived_chapters = [c for c in downloaded_chapters if c.get("status") == 'archived']
+        active_chapters = []
+        archived_chapters = []
+        for chapter in downloaded_chapters: # Single pass; both lists keep download order
+            (archived_chapters if chapter.get("status") == 'archived' else active_chapters).append(chapter)
+
+        # Fetched once and shared by every volume of both the active and archived variants
+        cover_image = self._download_cover_image(progress_data.get("cover_image_url"))
 
         if active_chapters:
-            progress_data = self._process_epub_generation(progress_data, active_chapters, chapters_per_volume, is_archived_variant=False)
+            progress_data = self._process_epub_generation(progress_data, active_chapters, chapters_per_volume, is_archived_variant=False, cover_image=cover_image, compresslevel=compresslevel)
 
         if archived_chapters:
-            progress_data = self._process_epub_generation(progress_data, archived_chapters, chapters_per_volume, is_archived_variant=True)
+            progress_data = self._process_epub_generation(progress_data, archived_chapters, chapters_per_volume, is_archived_variant=True, cover_image=cover_image, compresslevel=compresslevel)
 
         return progress_data
 
-    def _process_epub_generation(self, progress_data: Dict[Any, Any], chapters: List[Dict[Any, Any]], chapters_per_volume: Optional[int], is_archived_variant: bool = False) -> Dict[Any, Any]:
+    def _process_epub_generation(self, progress_data: Dict[Any, Any], chapters: List[Dict[Any, Any]], chapters_per_volume: Optional[int], is_archived_variant: bool = False, cover_image: Optional[Tuple[str, bytes]] = None, compresslevel: int = EPUB_COMPRESSLEVEL) -> Dict[Any, Any]:
         story_id = self.pm.get_story_id()
         story_title = progress_data.get("effective_title", "Unknown Title")
         author_name = progress_data.get("author", "Unknown Author")
         synopsis = progress_data.get("synopsis")
-        cover_image_url = progress_data.get("cover_image_url")
 
         if not chapters:
             return progress_data
@@ -93,10 +147,10 @@ class EPUBGenerator:
         ebooks_base_path = self.pm.get_ebooks_story_dir()
         os.makedirs(ebooks_base_path, exist_ok=True)
 
-        processed_content_path = self.pm.get_processed_content_story_dir()
+        processed_content_path = self.pm.get_processed_content_story_dir() # Resolved once; joined per chapter below
 
         # Sanitize story title for filename
-        sanitized_story_title = "".join(c if c.isalnum() or c in [' ', '.', '_'] else '_' for c in story_title).replace(' ', '_')
+        sanitized_story_title = _FILENAME_UNSAFE_CHARS.sub('_', story_title)
 
         num_chapters = len(chapters)
         if chapters_per_volume is None or chapters_per_volume <= 0 or chapters_per_volume >= num_chapters:
@@ -111,6 +165,7 @@ class EPUBGenerator:
             ]
             volume_number_offset = 1
 
+        volume_jobs = [] # (book, epub_filename, epub_filepath) for each volume with content
 
         for i, volume_chapters in enumerate(volume_chapters_list):
             volume_number = i + volume_number_offset
@@ -134,27 +189,13 @@ class EPUBGenerator:
             book.set_language('en')
             book.add_author(author_name)
 
-            # Download and set cover image
-            local_cover_path = None
-            if cover_image_url:
-                local_cover_path = self._download_cover_image(cover_image_url)
-                if local_cover_path:
-                    try:
-                        with open(local_cover_path, 'rb') as f:
-                            cover_image_data = f.read()
-                        # Determine image mime type from extension
-                        img_ext = os.path.splitext(local_cover_path)[1].lower()
-                        mime_type = 'image/jpeg' # default
-                        if img_ext == '.png':
-                            mime_type = 'image/png'
-                        elif img_ext == '.gif':
-                             mime_type = 'image/gif'
-
-                        book.set_cover(os.path.basename(local_cover_path), cover_image_data, create_page=True)
-                    except FileNotFoundError:
-                        logger.error(f"Cover image file not found at {local_cover_path} for story {story_id} during EPUB generation.")
-                    except Exception as e:
-                        logger.error(f"Error processing cover image for story {story_id}: {e}")
+            # Set the cover image downloaded once in generate_epub
+            if cover_image:
+                cover_file_name, cover_image_data = cover_image
+                try:
+                    book.set_cover(cover_file_name, cover_image_data, create_page=True)
+                except Exception as e:
+                    logger.error(f"Error processing cover image for story {story_id}: {e}")
 
 
             epub_items_for_book = [] # Holds all EPUB items (synopsis, chapters) for correct ordering
@@ -182,11 +223,10 @@ class EPUBGenerator:
                     logger.error(f"Missing 'local_processed_filename' for chapter {chapter_info.get('download_order')} in story {story_id}. Skipping.")
                     continue
 
-                html_file_path = self.pm.get_processed_content_chapter_filepath(local_filename)
+                html_file_path = os.path.join(processed_content_path, local_filename)
 
                 try:
-                    with open(html_file_path, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
+                    html_content = self._read_chapter_html(html_file_path)
                 except FileNotFoundError:
                     logger.error(f"Processed HTML file not found: {html_file_path} for story {self.pm.get_story_id()}. Skipping chapter.")
                     continue
@@ -208,15 +248,6 @@ class EPUBGenerator:
 
             if not any(item for item in epub_items_for_book if item.media_type == 'application/xhtml+xml'): # Check if there are any actual content pages
                 logger.warning(f"No valid content (synopsis or chapters) found for volume {volume_number} of story {story_id}. Skipping EPUB generation for this volume.")
-                if local_cover_path and os.path.exists(local_cover_path): # Clean up downloaded cover
-                    try:
-                        os.remove(local_cover_path)
-                        # Attempt to remove the temp_cover_dir if it's empty
-                        temp_cover_dir = os.path.dirname(local_cover_path)
-                        if not os.listdir(temp_cover_dir):
-                            os.rmdir(temp_cover_dir)
-                    except OSError as e:
-                        logger.warning(f"Could not clean up temporary cover file/directory for story {story_id}: {e}")
                 continue
 
             # Define Table of Contents for NCX
@@ -239,27 +270,20 @@ class EPUBGenerator:
                 epub_filename = f"{sanitized_story_title}{suffix}.epub"
 
             epub_filepath = self.pm.get_epub_filepath(epub_filename)
+            volume_jobs.append((book, epub_filename, epub_filepath))
 
-            try:
-                epub.write_epub(epub_filepath, book, {})
+        if len(volume_jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_EPUB_WRITES, len(volume_jobs))) as executor:
+                write_errors = list(executor.map(lambda job: self._write_epub_file(job[0], job[2], compresslevel), volume_jobs))
+        else:
+            write_errors = [self._write_epub_file(book, epub_filepath, compresslevel) for book, _, epub_filepath in volume_jobs]
+
+        # Progress is updated serially, in volume order, whichever write finished first
+        for (book, epub_filename, epub_filepath), write_error in zip(volume_jobs, write_errors):
+            if write_error is None:
                 progress_data = add_epub_file_to_progress(progress_data, epub_filename, epub_filepath, story_id, self.pm.get_workspace_root())
                 logger.info(f"Successfully generated EPUB: {epub_filepath}")
-            except Exception as e:
-                logger.error(f"Failed to write EPUB file {epub_filepath} for story {self.pm.get_story_id()}: {e}")
-            finally:
-                # Clean up downloaded cover image after EPUB generation for this volume
-                if local_cover_path and os.path.exists(local_cover_path):
-                    try:
-                        os.remove(local_cover_path)
-                        # Attempt to remove the temp_cover_dir if it's empty and we are on the last volume
-                        if i == len(volume_chapters_list) -1: # only try to remove dir after last volume
-                            temp_cover_dir = os.path.dirname(local_cover_path)
-                            if os.path.exists(temp_cover_dir) and not os.listdir(temp_cover_dir):
-                                os.rmdir(temp_cover_dir)
-                                logger.info(f"Successfully removed temporary cover directory: {temp_cover_dir}")
-                            elif os.path.exists(temp_cover_dir):
-                                logger.debug(f"Temporary cover directory {temp_cover_dir} is not empty, not removing.")
-                    except OSError as e:
-                        logger.warning(f"Could not clean up temporary cover file/directory for story {story_id} after EPUB generation: {e}")
+            else:
+                logger.error(f"Failed to write EPUB file {epub_filepath} for story {self.pm.get_story_id()}: {write_error}")
 
         return progress_data
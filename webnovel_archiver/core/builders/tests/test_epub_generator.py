@@ -0,0 +1,156 @@
+import os
+import mmap
+
+import pytest
+
+from ebooklib import epub
+
+from webnovel_archiver.core.path_manager import PathManager
+from webnovel_archiver.core.builders import epub_generator
+from webnovel_archiver.core.builders.epub_generator import EPUBGenerator
+
+def _build_story(workspace_root: str, story_id: str, num_chapters: int = 3) -> dict:
+    pm = PathManager(workspace_root, story_id)
+    os.makedirs(pm.get_processed_content_story_dir(), exist_ok=True)
+
+    chapters = []
+    for order in range(1, num_chapters + 1):
+        filename = f"chapter_{str(order).zfill(5)}_clean.html"
+        with open(pm.get_processed_content_chapter_filepath(filename), 'w', encoding='utf-8') as f:
+            f.write("".join(f"<p>Paragraph {i} of chapter {order}, with some repeated prose.</p>" for i in range(300)))
+        chapters.append({
+            "title": f"Chapter {order}",
+            "download_order": order,
+            "local_processed_filename": filename,
+            "status": "active",
+        })
+
+    return {
+        "effective_title": "Test Story",
+        "author": "Test Author",
+        "downloaded_chapters": chapters,
+        "last_epub_processing": {"generated_epub_files": []},
+    }
+
+def test_generate_epub_fast_mode(tmp_path):
+    epub_sizes = {}
+    for compresslevel in (1, 9):
+        workspace_root = str(tmp_path / f"workspace_level_{compresslevel}")
+        pm = PathManager(workspace_root, "royalroad-1")
+        progress_data = _build_story(workspace_root, "royalroad-1")
+
+        progress_data = EPUBGenerator(pm).generate_epub(progress_data, compresslevel=compresslevel)
+
+        generated = progress_data["last_epub_processing"]["generated_epub_files"]
+        assert len(generated) == 1
+        book = epub.read_epub(generated[0]["path"])
+        assert book.get_item_with_href("chap_3.xhtml") is not None
+        epub_sizes[compresslevel] = os.path.getsize(generated[0]["path"])
+
+    assert epub_sizes[1] > epub_sizes[9]
+
+PNG_COVER_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 16
+
+class _FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+class _FakeSession:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return _FakeResponse(self.content)
+
+def test_generate_epub_downloads_cover_once_for_all_volumes(tmp_path, monkeypatch):
+    fake_session = _FakeSession(PNG_COVER_BYTES)
+    monkeypatch.setattr(EPUBGenerator, "_get_session", classmethod(lambda cls: fake_session))
+
+    workspace_root = str(tmp_path / "workspace")
+    pm = PathManager(workspace_root, "royalroad-1")
+    progress_data = _build_story(workspace_root, "royalroad-1")
+    progress_data["cover_image_url"] = "https://example.com/cover"
+
+    progress_data = EPUBGenerator(pm).generate_epub(progress_data, chapters_per_volume=2)
+
+    assert fake_session.calls == [("https://example.com/cover", {"timeout": 15})]
+    generated = progress_data["last_epub_processing"]["generated_epub_files"]
+    assert len(generated) == 2
+    for entry in generated:
+        cover_item = epub.read_epub(entry["path"]).get_item_with_href("cover.png")
+        assert cover_item is not None
+        assert cover_item.get_content() == PNG_COVER_BYTES
+    assert not os.path.exists(pm.get_temp_cover_story_dir())
+
+@pytest.mark.parametrize("data, expected", [
+    (PNG_COVER_BYTES, "png"),
+    (b'\xff\xd8\xff\xe0\x00\x10JFIF\x00', "jpeg"),
+    (b'GIF89a\x01\x00\x01\x00', "gif"),
+    (b'RIFF\x24\x00\x00\x00WEBPVP8 ', "webp"),
+    (b'<html>Not an image</html>', None),
+])
+def test_detect_image_type_from_magic_bytes(data, expected):
+    assert epub_generator._detect_image_type(data) == expected
+
+def test_shared_session_ignores_retry_after_header(monkeypatch):
+    monkeypatch.setattr(EPUBGenerator, "_session", None)
+    retry = EPUBGenerator._get_session().get_adapter("https://example.com").max_retries
+    assert retry.respect_retry_after_header is False
+    assert retry.total == 3
+
+def test_generate_epub_multiple_volumes_recorded_in_volume_order(tmp_path):
+    workspace_root = str(tmp_path / "workspace")
+    pm = PathManager(workspace_root, "royalroad-1")
+    progress_data = _build_story(workspace_root, "royalroad-1", num_chapters=6)
+
+    progress_data = EPUBGenerator(pm).generate_epub(progress_data, chapters_per_volume=2)
+
+    generated = progress_data["last_epub_processing"]["generated_epub_files"]
+    assert [entry["name"] for entry in generated] == [f"Test_Story_vol_{n}.epub" for n in range(1, 4)]
+    for n, entry in enumerate(generated, start=1):
+        book = epub.read_epub(entry["path"])
+        assert book.get_item_with_href(f"chap_{2 * n}.xhtml") is not None
+
+def test_generate_epub_skips_volume_whose_write_fails(tmp_path, monkeypatch):
+    real_write_epub = epub.write_epub
+    def failing_write_epub(name, book, options=None):
+        if name.endswith("_vol_2.epub"):
+            raise OSError("Simulated write failure")
+        return real_write_epub(name, book, options)
+    monkeypatch.setattr(epub, "write_epub", failing_write_epub)
+
+    workspace_root = str(tmp_path / "workspace")
+    pm = PathManager(workspace_root, "royalroad-1")
+    progress_data = _build_story(workspace_root, "royalroad-1", num_chapters=6)
+
+    progress_data = EPUBGenerator(pm).generate_epub(progress_data, chapters_per_volume=2)
+
+    generated = progress_data["last_epub_processing"]["generated_epub_files"]
+    assert [entry["name"] for entry in generated] == ["Test_Story_vol_1.epub", "Test_Story_vol_3.epub"]
+    assert not os.path.exists(pm.get_epub_filepath("Test_Story_vol_2.epub"))
+
+def test_generate_epub_reads_large_chapters_through_mmap(tmp_path, monkeypatch):
+    mapped_files = []
+    real_mmap = mmap.mmap
+    monkeypatch.setattr(mmap, "mmap", lambda *args, **kwargs: mapped_files.append(args) or real_mmap(*args, **kwargs))
+    monkeypatch.setattr(epub_generator, "MMAP_CHAPTER_THRESHOLD_BYTES", 1024) # Test chapters are ~18 KB
+
+    workspace_root = str(tmp_path / "workspace")
+    pm = PathManager(workspace_root, "royalroad-1")
+    progress_data = _build_story(workspace_root, "royalroad-1")
+    # A Windows-style line ending must not break the chapter read on the mapped path
+    with open(pm.get_processed_content_chapter_filepath("chapter_00002_clean.html"), 'a', encoding='utf-8', newline='') as f:
+        f.write("\r\n<p>Ünïcode tail – of chapter 2</p>")
+
+    progress_data = EPUBGenerator(pm).generate_epub(progress_data)
+
+    assert len(mapped_files) == 3
+    book = epub.read_epub(progress_data["last_epub_processing"]["generated_epub_files"][0]["path"])
+    chapter_text = book.get_item_with_href("chap_2.xhtml").get_content().decode('utf-8')
+    assert "Paragraph 299 of chapter 2" in chapter_text
+    assert "Ünïcode tail – of chapter 2" in chapter_text
@@ -226,13 +226,13 @@ class GDriveSync(BaseSyncService):
 
         try:
             if file_id:
-                logger.debug(f"Fetching metadata for file ID: {file_id}")
+                logger.debug("Fetching metadata for file ID: %s", file_id)
                 file_meta = self.service.files().get(fileId=file_id, fields='id, name, modifiedTime, webViewLink, size').execute()
                 return file_meta
 
             # If file_id not provided, use file_name and folder_id
             if file_name and folder_id:
-                logger.debug(f"Fetching metadata for file name: '{file_name}' in folder ID: {folder_id}")
+                logger.debug("Fetching metadata for file name: '%s' in folder ID: %s", file_name, folder_id)
                 # This reuses _get_file_id to find the file first, then fetches full metadata
                 target_file_id = self._get_file_id(file_name, folder_id)
                 if target_file_id:
@@ -243,7 +243,7 @@ class GDriveSync(BaseSyncService):
                     return None
         except HttpError as error:
             if error.resp.status == 404:
-                logger.debug(f"File not found (file_id: {file_id}, file_name: {file_name}, folder_id: {folder_id}).")
+                logger.debug("File not found (file_id: %s, file_name: %s, folder_id: %s).", file_id, file_name, folder_id)
                 return None
             logger.error(f"An API error occurred while getting file metadata: {error}")
             # Consider re-raising for certain errors or returning None for others
@@ -272,7 +272,7 @@ class GDriveSync(BaseSyncService):
                 page_token = response.get('nextPageToken', None)
                 if page_token is None:
                     break
-            logger.debug(f"Found {len(files_list)} files in folder ID '{folder_id}'.")
+            logger.debug("Found %d files in folder ID '%s'.", len(files_list), folder_id)
             return files_list
         except HttpError as error:
             logger.error(f"An API error occurred while listing files in folder '{folder_id}': {error}")
@@ -94,7 +94,7 @@ class ConfigManager:
             # However, DEFAULT_WORKSPACE_PATH is already absolute.
             # This logic mainly applies if user sets a relative path in settings.ini
             resolved_path = os.path.join(PROJECT_ROOT, path_from_config)
-            logger.debug(f"Resolved relative path from config '{path_from_config}' to '{resolved_path}' (relative to project root '{PROJECT_ROOT}')")
+            logger.debug("Resolved relative path from config '%s' to '%s' (relative to project root '%s')", path_from_config, resolved_path, PROJECT_ROOT)
             return os.path.abspath(resolved_path) # Ensure it's absolute
 
         return os.path.abspath(path_from_config) # Ensure it's absolute
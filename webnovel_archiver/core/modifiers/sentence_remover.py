@@ -119,7 +119,7 @@ class SentenceRemover:
                         # After extracting the text node, check if the parent element is now empty
                         # This means it has no visible text content and no other child tags
                         if parent and not parent.get_text(strip=True) and not parent.find(True) and parent.name not in ['body', 'html', 'head']:
-                            logger.debug(f"Removing empty parent tag: <{parent.name}>")
+                            logger.debug("Removing empty parent tag: <%s>", parent.name)
                             parent.decompose()
                     else:
                         text_node.replace_with(NavigableString(modified_text))
@@ -1,17 +1,16 @@
 import os
 import shutil
 import datetime
-import copy
 import json
 from typing import Dict, Any, Optional, Callable, Union
 import requests
 
 from webnovel_archiver.utils.logger import get_logger
-from webnovel_archiver.utils.slug_generator import generate_slug
 from .fetchers.fetcher_factory import FetcherFactory
 from .fetchers.exceptions import UnsupportedSourceError
 from .builders.epub_generator import EPUBGenerator
 from .storage.progress_manager import load_progress, save_progress
+from .storage.index_manager import load_index, save_index
 from .parsers.html_cleaner import HTMLCleaner
 from .modifiers.sentence_remover import SentenceRemover
 from .path_manager import PathManager
@@ -50,6 +49,7 @@ def _process_chapters(
         updated_downloaded_chapters.append(chapter_entry)
 
     successfully_processed_new_or_updated_count = 0
+    content_dirs_created = False # Raw/processed dirs are created once, on the first chapter that needs them
     for i, chapter_info in enumerate(chapters_info_list):
         _call_progress_callback({
             "status": "info",
@@ -90,8 +90,12 @@ def _process_chapters(
                     logger.warning(f"Content not found for chapter: {chapter_info.chapter_title}. Skipping.")
                     continue
                 
+                if not content_dirs_created:
+                    for content_dir in (pm.get_raw_content_story_dir(), pm.get_processed_content_story_dir()):
+                        os.makedirs(content_dir, exist_ok=True)
+                    content_dirs_created = True
+
                 raw_filename = f"chapter_{str(chapter_info.download_order).zfill(5)}_{chapter_info.source_chapter_id}.html"
-                os.makedirs(pm.get_raw_content_story_dir(), exist_ok=True)
                 with open(pm.get_raw_content_chapter_filepath(raw_filename), 'w', encoding='utf-8') as f:
                     f.write(raw_html_content)
 
@@ -103,7 +107,6 @@ def _process_chapters(
                     progress_data["sentence_removal_config_used"] = sentence_removal_file
 
                 processed_filename = f"chapter_{str(chapter_info.download_order).zfill(5)}_{chapter_info.source_chapter_id}_clean.html"
-                os.makedirs(pm.get_processed_content_story_dir(), exist_ok=True)
                 with open(pm.get_processed_content_chapter_filepath(processed_filename), 'w', encoding='utf-8') as f:
                     f.write(cleaned_html_content)
 
@@ -206,15 +209,14 @@ def archive_story(
 
     workspace_path_manager = PathManager(workspace_root)
     index_path = workspace_path_manager.index_path
-    index = {}
-    if os.path.exists(index_path):
-        try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                index = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to load or parse index file at {index_path}: {e}", exc_info=True)
-            _call_progress_callback({"status": "error", "message": f"Failed to load story index: {e}"})
-            return None
+    try:
+        index = load_index(index_path)
+    except FileNotFoundError:
+        index = {} # No index yet; it is written below once this story is added
+    except (json.JSONDecodeError, IOError) as e:
+        logger.error(f"Failed to load or parse index file at {index_path}: {e}", exc_info=True)
+        _call_progress_callback({"status": "error", "message": f"Failed to load story index: {e}"})
+        return None
 
     story_folder_name = index.get(permanent_id)
 
@@ -225,8 +227,7 @@ def archive_story(
     if index.get(permanent_id) != story_folder_name:
         index[permanent_id] = story_folder_name
         try:
-            with open(index_path, 'w', encoding='utf-8') as f:
-                json.dump(index, f, indent=4)
+            save_index(index_path, index)
             logger.info(f"Updated index for {permanent_id} to point to {story_folder_name}")
         except IOError as e:
             logger.error(f"Failed to write to index file at {index_path}: {e}", exc_info=True)
@@ -97,14 +97,6 @@ class PathManager:
         """
         return os.path.join(self.get_ebooks_story_dir(), self.TEMP_COVER_DIR_NAME)
 
-    def get_cover_image_filepath(self, cover_filename: str) -> str:
-        """
-        Returns the full path to a specific cover image file within the temp cover directory.
-        """
-        if not cover_filename:
-            raise ValueError("cover_filename cannot be empty.")
-        return os.path.join(self.get_temp_cover_story_dir(), cover_filename)
-
     # Generic directory getter for base directories (raw, processed, ebooks, archival_status)
     def get_base_directory(self, dir_type: str) -> str:
         """
@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+from typing import Dict, Tuple
+
+from webnovel_archiver.utils.json_utils import load_json_file
+from webnovel_archiver.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Parsed index files keyed by path. Each entry remembers the (st_mtime_ns, st_size)
+# of the file when it was read, so a later call can reuse it while the file is unchanged.
+_index_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+# Indexes with more entries than this have their keys and folder names interned after
+# parsing. The JSON decoder allocates a separate object for every string, so interning
+# collapses equal ones (e.g. a folder name identical to its permanent ID, or the same ID
+# interned elsewhere) into a single object and keeps a large index smaller in memory.
+# Below it the interning pass costs more than it saves.
+INTERN_THRESHOLD = 100
+
+def _stat_key(index_path: str) -> Tuple[int, int]:
+    st = os.stat(index_path)
+    return (st.st_mtime_ns, st.st_size)
+
+def load_index(index_path: str) -> Dict[str, str]:
+    """
+    Loads the story index (permanent_id -> story folder name) from index_path.
+    The parsed result is cached and reused for as long as the file's mtime and size are unchanged.
+    Raises FileNotFoundError if the file is missing and json.JSONDecodeError if it is corrupted.
+    """
+    stat_key = _stat_key(index_path)
+    cached = _index_cache.get(index_path)
+    if cached is not None and cached[0] == stat_key:
+        logger.debug("Using cached story index for %s", index_path)
+        return dict(cached[1]) # Copy so callers can mutate without touching the cache
+
+    index = load_json_file(index_path)
+    if len(index) > INTERN_THRESHOLD:
+        index = {sys.intern(k): sys.intern(v) if isinstance(v, str) else v for k, v in index.items()}
+
+    _index_cache[index_path] = (stat_key, index)
+    return dict(index)
+
+def save_index(index_path: str, index: Dict[str, str]) -> None:
+    """Writes the story index to index_path and refreshes the cached copy."""
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=4)
+    _index_cache[index_path] = (_stat_key(index_path), dict(index))
@@ -39,4 +39,4 @@ def update_cloud_backup_status(progress_data: Dict[str, Any], backup_info: Dict[
         progress_data["cloud_backup_status"] = _get_new_progress_structure("dummy")["cloud_backup_status"]
 
     progress_data["cloud_backup_status"].update(backup_info)
-    logger.debug(f"Cloud backup status updated for story {progress_data.get('story_id', 'N/A')}")
+    logger.debug("Cloud backup status updated for story %s", progress_data.get('story_id', 'N/A'))
@@ -25,9 +25,9 @@ def add_epub_file_to_progress(progress_data: Dict[str, Any], file_name: str, fil
     if not any(ep_file['path'] == file_path for ep_file in epub_files_list):
         epub_files_list.append({"name": file_name, "path": file_path})
         progress_data["last_epub_processing"]["generated_epub_files"] = epub_files_list
-        logger.debug(f"EPUB file '{file_name}' added for story {story_id}")
+        logger.debug("EPUB file '%s' added for story %s", file_name, story_id)
     else:
-        logger.debug(f"EPUB file '{file_name}' with path '{file_path}' already exists in progress data. Skipping add.")
+        logger.debug("EPUB file '%s' with path '%s' already exists in progress data. Skipping add.", file_name, file_path)
     return progress_data
 
 def get_epub_file_details(progress_data: Dict[str, Any], story_id: str, workspace_root: str) -> List[Dict[str, str]]: # Removed DEFAULT_WORKSPACE_ROOT default
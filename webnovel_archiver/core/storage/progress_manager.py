@@ -1,10 +1,9 @@
 import json
 import os
-import re
 import datetime
 from typing import Dict, Optional, List, Any
-from urllib.parse import urlparse
 
+from webnovel_archiver.utils.json_utils import load_json_file, dump_json_file
 from webnovel_archiver.utils.logger import get_logger
 from webnovel_archiver.core.path_manager import PathManager
 from .progress_epub import add_epub_file_to_progress, get_epub_file_details
@@ -91,8 +90,7 @@ def load_progress(story_id: str, workspace_root: str) -> Dict[str, Any]: # Remov
 
     if os.path.exists(filepath):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(filepath)
 
             # Migration logic for chapter status fields
             # This should be done *before* other structural checks like version or missing top-level keys,
@@ -200,9 +198,8 @@ def save_progress(story_id: str, progress_data: Dict[str, Any], workspace_root:
     progress_data["version"] = PROGRESS_FILE_VERSION # Ensure version is current
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, indent=2, ensure_ascii=False)
-        logger.debug(f"Progress saved for story {story_id} to {filepath}")
+        dump_json_file(filepath, progress_data)
+        logger.debug("Progress saved for story %s to %s", story_id, filepath)
     except IOError as e:
         logger.error(f"Could not write progress file {filepath}: {e}", exc_info=True)
     except Exception as e:
@@ -0,0 +1,54 @@
+import os
+import sys
+import json
+
+import pytest
+
+from webnovel_archiver.core.storage import index_manager
+from webnovel_archiver.core.storage.index_manager import INTERN_THRESHOLD, load_index, save_index
+
+def test_load_index_reuses_parsed_index_until_file_changes(tmp_path, monkeypatch):
+    index_path = str(tmp_path / "index.json")
+    save_index(index_path, {"royalroad-1": "royalroad-1"})
+
+    json_loads = []
+    real_load_json_file = index_manager.load_json_file
+    monkeypatch.setattr(index_manager, "load_json_file", lambda path: json_loads.append(path) or real_load_json_file(path))
+
+    # save_index primes the cache, so the first load does not re-parse the file
+    assert load_index(index_path) == {"royalroad-1": "royalroad-1"}
+    assert len(json_loads) == 0
+
+    # Mutating the returned dict must not leak into the cache
+    index = load_index(index_path)
+    index["royalroad-2"] = "royalroad-2"
+    assert load_index(index_path) == {"royalroad-1": "royalroad-1"}
+    assert len(json_loads) == 0
+
+    # An external write (different size) invalidates the cached copy
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({"royalroad-1": "royalroad-1", "royalroad-3": "legacy-folder"}, f)
+    assert load_index(index_path) == {"royalroad-1": "royalroad-1", "royalroad-3": "legacy-folder"}
+    assert len(json_loads) == 1
+
+def test_load_index_missing_file_raises(tmp_path):
+    missing_path = os.path.join(str(tmp_path), "index.json")
+    with pytest.raises(FileNotFoundError):
+        load_index(missing_path)
+
+def test_load_index_corrupted_file_raises_json_decode_error(tmp_path):
+    index_path = str(tmp_path / "index.json")
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write("{not valid json")
+    with pytest.raises(json.JSONDecodeError):
+        load_index(index_path)
+
+def test_load_index_interns_strings_of_large_index(tmp_path):
+    index_path = str(tmp_path / "index.json")
+    large_index = {f"royalroad-{i}": f"story-folder-{i}" for i in range(INTERN_THRESHOLD + 1)}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump(large_index, f)
+
+    index = load_index(index_path)
+    assert index == large_index
+    assert index["royalroad-0"] is sys.intern("story-folder-0")
@@ -21,26 +21,16 @@ from webnovel_archiver.core.storage.progress_epub import (
 
 logger = get_logger(__name__)
 
-def test_progress_manager():
+def test_progress_manager(tmp_path):
     logger.info("--- Testing ProgressManager functions ---") # Use logger
 
     rr_url = "https://www.royalroad.com/fiction/117255/rend-a-tale-of-something"
     test_story_id = "royalroad-117255"
-    test_workspace = os.path.abspath("_test_pm_workspace") # Make workspace path absolute
+    test_workspace = str(tmp_path / "_test_pm_workspace") # Per-test workspace; pytest removes it
     pm_for_test = PathManager(test_workspace, test_story_id) # PathManager for test setup
 
     logger.info(f"Test Story ID: {test_story_id}, Workspace: {test_workspace}")
 
-    # Clean up any previous test file for this ID
-    test_filepath = pm_for_test.get_progress_filepath() # Use PathManager
-    if os.path.exists(test_filepath):
-        os.remove(test_filepath)
-
-    story_status_dir = os.path.dirname(test_filepath)
-    if os.path.exists(story_status_dir):
-        if not os.listdir(story_status_dir):
-            os.rmdir(story_status_dir)
-
     # Create ebook dir for test
     ebook_dir_for_test = pm_for_test.get_ebooks_story_dir()
     os.makedirs(ebook_dir_for_test, exist_ok=True)
@@ -142,29 +132,12 @@ def test_progress_manager():
 
     logger.info("All tests passed (basic assertions).")
 
-    # Clean up
-    if os.path.exists(epub1_abs_path): os.remove(epub1_abs_path)
-    if os.path.exists(test_filepath): os.remove(test_filepath)
-    if os.path.exists(ebook_dir_for_test) and not os.listdir(ebook_dir_for_test): os.rmdir(ebook_dir_for_test)
-
-    story_archival_dir = pm_for_test.get_archival_status_story_dir()
-    if os.path.exists(story_archival_dir) and not os.listdir(story_archival_dir): os.rmdir(story_archival_dir)
-
-    # Clean up parent directories if they are empty and created by this test
-    for dir_type_name in [PathManager.EBOOKS_DIR_NAME, PathManager.ARCHIVAL_STATUS_DIR_NAME]:
-        parent_path = pm_for_test.get_base_directory(dir_type_name) # Use PathManager
-        if os.path.exists(parent_path) and not os.listdir(parent_path):
-            os.rmdir(parent_path)
-    if os.path.exists(test_workspace) and not os.listdir(test_workspace):
-        os.rmdir(test_workspace)
-    logger.info(f"Test workspace {test_workspace} cleaned up.")
-
-def test_get_epub_file_details_backward_compatibility():
+def test_get_epub_file_details_backward_compatibility(tmp_path):
     logger.info("--- Testing get_epub_file_details backward compatibility ---")
 
     # 1. Setup progress_data with old format epub entries
     old_format_story_id = "story_with_old_epubs"
-    old_format_workspace = os.path.abspath("_test_pm_old_format_workspace") # Make workspace path absolute
+    old_format_workspace = str(tmp_path / "_test_pm_old_format_workspace")
     old_format_pm = PathManager(old_format_workspace, old_format_story_id)
 
     # Ensure workspace and ebook directory exist for this test
@@ -221,25 +194,3 @@ def test_get_epub_file_details_backward_compatibility():
     assert found_absolute_as_dict, f"Did not find processed entry for '{abs_path_epub_string}'"
 
     logger.info("get_epub_file_details backward compatibility test passed.")
-
-    # Clean up test files and directories for this specific test
-    if os.path.exists(abs_path_for_relative_epub): os.remove(abs_path_for_relative_epub)
-    # No progress file was saved for old_format_story_id in this direct test of get_epub_file_details
-    # so no progress file to remove for old_format_story_id
-    if os.path.exists(old_format_ebook_dir) and not os.listdir(old_format_ebook_dir): os.rmdir(old_format_ebook_dir)
-
-    # old_format_story_archival_dir = os.path.join(old_format_workspace, ARCHIVAL_STATUS_DIR, old_format_story_id) # Replaced
-    old_format_story_archival_dir = old_format_pm.get_archival_status_story_dir()
-    if os.path.exists(old_format_story_archival_dir) and not os.listdir(old_format_story_archival_dir): os.rmdir(old_format_story_archival_dir)
-
-    for dir_type_name in [PathManager.EBOOKS_DIR_NAME, PathManager.ARCHIVAL_STATUS_DIR_NAME]:
-        parent_path = old_format_pm.get_base_directory(dir_type_name) # Use PathManager
-        if os.path.exists(parent_path) and not os.listdir(parent_path):
-            os.rmdir(parent_path)
-    if os.path.exists(old_format_workspace) and not os.listdir(old_format_workspace):
-        os.rmdir(old_format_workspace)
-    logger.info(f"Old format test workspace {old_format_workspace} cleaned up.")
-
-if __name__ == '__main__':
-    test_progress_manager()
-    test_get_epub_file_details_backward_compatibility()
@@ -1,20 +1,15 @@
 import os
 import json
 import datetime
-import sys
-import html # For escaping HTML content
 import webbrowser # Added to open the report in a browser
 
-# Adjust path to import sibling modules
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, PROJECT_ROOT)
-
 from webnovel_archiver.core.config_manager import ConfigManager
-from webnovel_archiver.core.storage.progress_manager import load_progress, get_epub_file_details # Removed constants
+from webnovel_archiver.core.storage.progress_manager import load_progress # Removed constants
 # from webnovel_archiver.core.path_manager import PathManager # For ARCHIVAL_STATUS_DIR_NAME
 from webnovel_archiver.core.path_manager import PathManager # Import PathManager to access its constants
+from webnovel_archiver.core.storage.index_manager import load_index
 from webnovel_archiver.utils.logger import get_logger
-from .report.utils import format_timestamp, sanitize_for_css_class
+from .report.utils import format_timestamp
 from .report.html_generator import generate_story_card_html, get_html_skeleton
 from .report.processor import process_story_for_report
 
@@ -72,14 +67,12 @@ def main():
         logger.error(f"Error during path determination: {e}", exc_info=True)
         return
 
-    if not os.path.exists(index_path):
+    try:
+        story_index = load_index(index_path)
+    except FileNotFoundError:
         logger.error(f"Index file not found at {index_path}. Cannot generate report.")
         print(f"Error: Story index '{index_path}' not found. Please run the archiver at least once to create it.")
         return
-
-    try:
-        with open(index_path, 'r', encoding='utf-8') as f:
-            story_index = json.load(f)
     except (json.JSONDecodeError, IOError) as e:
         logger.error(f"Failed to load or parse index file: {e}", exc_info=True)
         return
@@ -92,7 +85,7 @@ def main():
 
     all_story_data = []
     for permanent_id, story_folder_name in story_index.items():
-        logger.debug(f"Processing story: Permanent ID: {permanent_id}, Folder: {story_folder_name}")
+        logger.debug("Processing story: Permanent ID: %s, Folder: %s", permanent_id, story_folder_name)
         try:
             progress_data = load_progress(story_folder_name, workspace_root)
             if progress_data and progress_data.get("story_id"):
@@ -5,7 +5,7 @@ from webnovel_archiver.core.storage.progress_epub import get_epub_file_details
 logger = get_logger(__name__)
 
 def process_story_for_report(progress_data, workspace_root):
-    logger.debug(f"Processing story for report: {progress_data.get('story_id')}")
+    logger.debug("Processing story for report: %s", progress_data.get('story_id'))
     story_id = progress_data.get('story_id')
 
     # Download Progress & Chapter Status Analysis
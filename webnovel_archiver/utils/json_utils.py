@@ -0,0 +1,52 @@
+import json
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError: # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+# Files at least this large are memory-mapped and handed to orjson as a buffer,
+# which avoids copying the whole file into a bytes object first. Below it the
+# mapping overhead outweighs the saved copy.
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+def load_json_file(filepath: str) -> Any:
+    """
+    Reads and parses a UTF-8 JSON file.
+
+    Uses orjson when it is installed and the stdlib json module otherwise.
+    Large files are memory-mapped rather than read into memory when using orjson.
+    Raises json.JSONDecodeError on malformed content in both cases
+    (orjson.JSONDecodeError is a subclass of it).
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release() # The mmap cannot be closed while a view is still exported
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dump_json_file(filepath: str, data: Any) -> None:
+    """
+    Writes data to filepath as UTF-8 JSON indented by two spaces, with non-ASCII
+    characters left unescaped. Uses orjson when it is installed and the stdlib json
+    module otherwise. Both give identical output for strings, integers, booleans,
+    None and nested lists/dicts (what progress files hold); float formatting can
+    differ, e.g. orjson writes 1e16 where json writes 1e+16.
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(filepath, 'wb') as f:
+            f.write(raw)
+        return
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
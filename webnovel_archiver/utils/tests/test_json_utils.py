@@ -0,0 +1,88 @@
+import json
+import mmap
+
+import pytest
+
+from webnovel_archiver.utils import json_utils
+from webnovel_archiver.utils.json_utils import load_json_file, dump_json_file
+
+SAMPLE_DATA = {"story_id": "royalroad-1", "title": "Ünïcode – “quoted”", "chapters": [{"order": 1, "status": "active"}]}
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Runs a test once with orjson (when installed) and once with the stdlib fallback."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+def test_dump_and_load_round_trip(tmp_path, json_backend):
+    filepath = str(tmp_path / "progress_status.json")
+    dump_json_file(filepath, SAMPLE_DATA)
+
+    assert load_json_file(filepath) == SAMPLE_DATA
+    with open(filepath, 'r', encoding='utf-8') as f:
+        text = f.read()
+    assert "Ünïcode" in text # Non-ASCII is written unescaped
+    assert text.startswith('{\n  "story_id"') # Two-space indent
+
+def test_load_large_file_is_memory_mapped(tmp_path, monkeypatch):
+    if json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    mapped_files = []
+    real_mmap = mmap.mmap
+    monkeypatch.setattr(mmap, "mmap", lambda *args, **kwargs: mapped_files.append(args) or real_mmap(*args, **kwargs))
+    monkeypatch.setattr(json_utils, "MMAP_THRESHOLD_BYTES", 16)
+
+    filepath = str(tmp_path / "index.json")
+    dump_json_file(filepath, SAMPLE_DATA)
+
+    assert load_json_file(filepath) == SAMPLE_DATA
+    assert len(mapped_files) == 1
+
+def test_load_small_file_is_not_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(mmap, "mmap", lambda *args, **kwargs: pytest.fail("small files must not be memory-mapped"))
+
+    filepath = str(tmp_path / "index.json")
+    dump_json_file(filepath, SAMPLE_DATA)
+
+    assert load_json_file(filepath) == SAMPLE_DATA
+
+@pytest.mark.parametrize("content", ["", "{not valid json", '{"a": 1'])
+def test_load_invalid_content_raises_json_decode_error(tmp_path, json_backend, content):
+    filepath = str(tmp_path / "progress_status.json")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json_file(filepath)
+
+def test_load_invalid_large_file_raises_json_decode_error(tmp_path, monkeypatch):
+    if json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_utils, "MMAP_THRESHOLD_BYTES", 4)
+
+    filepath = str(tmp_path / "progress_status.json")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write("{not valid json")
+
+    with pytest.raises(json.JSONDecodeError):
+        load_json_file(filepath)
+
+def test_dump_output_matches_between_orjson_and_stdlib(tmp_path, monkeypatch):
+    if json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    # Progress files only hold strings, integers, booleans, None and containers
+    data = dict(SAMPLE_DATA, tags=[], cloud_backup_status={}, synopsis=None, migrated=True,
+                escapes='Tab\t, newline\n, quote " and backslash \\')
+
+    orjson_path = str(tmp_path / "orjson.json")
+    dump_json_file(orjson_path, data)
+    monkeypatch.setattr(json_utils, "orjson", None)
+    stdlib_path = str(tmp_path / "stdlib.json")
+    dump_json_file(stdlib_path, data)
+
+    with open(orjson_path, 'rb') as f_orjson, open(stdlib_path, 'rb') as f_stdlib:
+        assert f_orjson.read() == f_stdlib.read()